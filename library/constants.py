@@ -2,13 +2,14 @@
 
 from os import environ
 from os.path import dirname, realpath, join
-from typing import Literal, Tuple, Dict
+from typing import Literal, Tuple
 
 __all__ = [
     "FLAT", "HORIZONTAL", "VERTICAL", "BROWSE", "END", "ROOT", "ALL",
     "HIDDEN", "NSEW", "NEW", "NE", "SE", "PADDING", "ZERO", "PADX", "RIGHT",
-    "LEFT", "PADY", "UP", "BOTTOM", "STYLE", "LIBRARY", "ICONS",
-    "USERPROFILE", "KEYVAULT", "CACHE",
+    "LEFT", "PADY", "UP", "BOTTOM", "LIBRARY", "ICONS",
+    "USERPROFILE", "KEYVAULT", "CACHE", "KEYRING_CACHE_SIZE",
+    "KEYRING_CACHE_TTL",
 ]
 
 # relief:
@@ -51,18 +52,6 @@ PADY: float = PADDING
 UP: Tuple[float, float] = (PADDING, ZERO)
 BOTTOM: Tuple[float, float] = (ZERO, PADDING)
 
-# style:
-STYLE: Dict[str, str] = {
-    "TFrame": "white",
-    "TButton": "white",
-    "TLabelframe": "white",
-    "TLabelframe.Label": "white",
-    "TLabel": "white",
-    "Horizontal.TScrollbar": "white",
-    "Vertical.TScrollbar": "white",
-    "Treeview": "white",
-}
-
 # library:
 LIBRARY: str = dirname(realpath(__file__))
 
@@ -77,3 +66,9 @@ KEYVAULT: str = join(USERPROFILE, ".keyvault")
 
 # cached accounts:
 CACHE: str = join(KEYVAULT, "keyvault.json")
+
+# fetched passwords kept in memory:
+KEYRING_CACHE_SIZE: int = 16
+
+# seconds a fetched password is kept in memory (0 disables caching):
+KEYRING_CACHE_TTL: float = 30
@@ -1,38 +1,42 @@
 # -*- coding: UTF-8 -*-
 
-from dataclasses import dataclass, field
 from os.path import join
 from tkinter import Tk, PhotoImage, StringVar
+from typing import Dict
 
 from .constants import ICONS
 
 __all__ = ["Icons", "Variables"]
 
+# icon name -> file path, resolved once at import:
+_ICON_PATHS: Dict[str, str] = {
+    name: join(ICONS, f"{name}.png") for name in ("cut", "copy", "paste")
+}
 
-@dataclass
-class Icons:
-    master: Tk = field(init=True)
-
-    def __post_init__(self):
-        self.cut: PhotoImage = self._get_image("cut")
-        self.copy: PhotoImage = self._get_image("copy")
-        self.paste: PhotoImage = self._get_image("paste")
 
-    def _get_image(self, target: str) -> PhotoImage:
-        path: str = self._get_path(target)
-        return PhotoImage(target, master=self.master, file=path)
+class Icons:
+    __slots__ = ("master", "cut", "copy", "paste")
 
-    @staticmethod
-    def _get_path(target: str) -> str:
-        return join(ICONS, f"{target}.png")
+    def __init__(self, master: Tk):
+        self.master: Tk = master
+        self.cut, self.copy, self.paste = (
+            PhotoImage(name, master=master, file=_ICON_PATHS[name])
+            for name in ("cut", "copy", "paste")
+        )
 
 
-@dataclass
 class Variables:
-    master: Tk = field(init=True)
-
-    def __post_init__(self):
-        self.service: StringVar = StringVar(self.master)
-        self.username: StringVar = StringVar(self.master)
-        self.password: StringVar = StringVar(self.master)
-        self.notification: StringVar = StringVar(self.master)
+    __slots__ = ("master", "service", "username", "password", "notification")
+
+    def __init__(self, master: Tk):
+        self.master: Tk = master
+        self.service: StringVar = StringVar(master)
+        self.username: StringVar = StringVar(master)
+        self.password: StringVar = StringVar(master)
+        self.notification: StringVar = StringVar(master)
+
+    def clear(self, *names: str):
+        """Reset the variables matching `names` in one Tcl call."""
+        self.master.tk.eval("; ".join(
+            f'set {getattr(self, name)} ""' for name in names
+        ))
@@ -1,25 +1,47 @@
 # -*- coding: UTF-8 -*-
 
-from os import makedirs
-from os.path import exists, isdir, realpath
+from itertools import islice
+from os import makedirs, fsync, replace
+from os.path import realpath
+from typing import Iterable, Iterator, Tuple, TypeVar
 
-__all__ = ["check_folder_path", "read_file", "write_file"]
+__all__ = ["check_folder_path", "read_file", "write_file", "chunks"]
 
+T = TypeVar("T")
 
-def check_folder_path(path: str) -> str:
-    path: str = realpath(path)
+# I/O buffer size in bytes:
+BUFFERING: int = 65536
 
-    if (not exists(path)) and (not isdir(path)):
-        makedirs(path, exist_ok=True)
 
+def check_folder_path(path: str) -> str:
+    path: str = realpath(path)
+    makedirs(path, exist_ok=True)
     return path
 
 
-def read_file(path: str) -> str:
-    with open(path, "r", encoding="UTF-8") as file_handle:
+def read_file(path: str) -> bytes:
+    with open(path, "rb", buffering=BUFFERING) as file_handle:
         return file_handle.read()
 
 
-def write_file(data: str, path: str):
-    with open(path, "w", encoding="UTF-8") as file_handle:
+def write_file(data: bytes, path: str):
+    """
+    Write `data` to a temporary file next to `path` and atomically
+    replace `path` with it so a failed write never leaves it corrupted.
+    """
+    temp: str = f"{path}.tmp"
+
+    with open(temp, "wb", buffering=BUFFERING) as file_handle:
         file_handle.write(data)
+        file_handle.flush()
+        fsync(file_handle.fileno())
+
+    replace(temp, path)
+
+
+def chunks(iterable: Iterable[T], size: int) -> Iterator[Tuple[T, ...]]:
+    """Split `iterable` into tuples of at most `size` items."""
+    iterator: Iterator[T] = iter(iterable)
+
+    while batch := tuple(islice(iterator, size)):
+        yield batch
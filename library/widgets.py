@@ -1,24 +1,32 @@
 # -*- coding: UTF-8 -*-
 
 from abc import ABC
+from collections import OrderedDict
+from functools import partial
 from json import dumps, loads
+from time import monotonic
 from tkinter import Tk, Event, TclError, Toplevel
 from tkinter.ttk import (
     Frame, LabelFrame, Label, Entry, Button,
     Scrollbar, Treeview, Style, Widget
 )
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Iterator
 
-from keyring import get_password, set_password, delete_password
-from keyring.errors import PasswordDeleteError
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return dumps(obj).encode("UTF-8")
+
+    _loads = loads
 
 from .constants import (
     ROOT, ALL, HIDDEN, NSEW, NEW, NE, SE, PADDING, PADX, PADY, UP, BOTTOM,
-    LEFT, RIGHT, BROWSE, HORIZONTAL, VERTICAL, END, FLAT, STYLE, CACHE,
-    KEYVAULT,
+    LEFT, RIGHT, BROWSE, HORIZONTAL, VERTICAL, END, FLAT, CACHE,
+    KEYVAULT, KEYRING_CACHE_SIZE, KEYRING_CACHE_TTL,
 )
 from .mapping import Icons, Variables
-from .utils import check_folder_path, read_file, write_file
+from .utils import check_folder_path, read_file, write_file, chunks
 
 __all__ = [
     "ToolTip", "SharedState", "KeyVault", "TreeFrame", "AccountFrame",
@@ -26,46 +34,132 @@ __all__ = [
 ]
 
 
+# (service, username) -> (fetch time, password), least recently used first:
+_kr_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+
+
+def _purge_passwords():
+    """Drop cached passwords older than `KEYRING_CACHE_TTL` seconds."""
+    now: float = monotonic()
+
+    for key in [
+        key for key, (fetched, _) in _kr_cache.items()
+        if now - fetched >= KEYRING_CACHE_TTL
+    ]:
+        del _kr_cache[key]
+
+
+def _get_password(service: str, username: str) -> str:
+    """
+    Fetch a password from the keyring, serving repeated requests from
+    memory for `KEYRING_CACHE_TTL` seconds.
+    """
+    # `keyring` backend discovery is slow, defer it to the first use:
+    from keyring import get_password
+
+    _purge_passwords()
+    key: Tuple[str, str] = (service, username)
+    entry: Tuple[float, str] = _kr_cache.get(key)
+
+    if entry is not None:
+        _kr_cache.move_to_end(key)
+        return entry[1]
+
+    value: str = get_password(service, username)
+
+    if (value is not None) and (KEYRING_CACHE_TTL > 0):
+        _kr_cache[key] = (monotonic(), value)
+
+        if len(_kr_cache) > KEYRING_CACHE_SIZE:
+            _kr_cache.popitem(last=False)
+
+    return value
+
+
+def _forget_password(service: str, username: str):
+    """
+    Drop a cached password after it was changed in the keyring.
+    Entries differing only in case are dropped as well since some
+    backends (e.g. Windows Credential Manager) ignore case.
+    """
+    _purge_passwords()
+    key: Tuple[str, str] = (service.lower(), username.lower())
+
+    for cached in [
+        (cached_service, cached_username)
+        for cached_service, cached_username in _kr_cache
+        if (cached_service.lower(), cached_username.lower()) == key
+    ]:
+        del _kr_cache[cached]
+
+
 class ToolTip:
+
+    # bind tag shared by all tooltipped widgets:
+    tag: str = "ToolTip"
+
+    # label options shared by all tooltips:
+    options: Dict[str, object] = {
+        "background": "lightyellow",
+        "borderwidth": 1,
+        "relief": "solid",
+        "padding": PADDING,
+    }
+
+    @staticmethod
+    def on_enter(event: Event):
+        event.widget.tooltip.schedule(event)
+
+    @staticmethod
+    def on_leave(event: Event):
+        event.widget.tooltip.cancel(event)
+
     def __init__(self, widget: Widget, text: str, delay: int = 1000):
         self.widget = widget
         self.text = text
         self.delay = delay  # milliseconds
         self.window = None
+        self.offset = None
         self.id = None
 
-        self.widget.bind("<Enter>", self.schedule)
-        self.widget.bind("<Leave>", self.cancel)
+        self.widget.tooltip = self
+        self.widget.bindtags((self.tag,) + self.widget.bindtags())
+
+        # Register the class bindings only once for all tooltips
+        if len(self.widget.bind_class(self.tag)) == 0:
+            self.widget.bind_class(self.tag, "<Enter>", self.on_enter)
+            self.widget.bind_class(self.tag, "<Leave>", self.on_leave)
 
     def schedule(self, event: Event):
         self.cancel(event)  # Cancel existing scheduled event if any
         self.id = self.widget.after(self.delay, self.enter)
 
     def enter(self):
-        x, y, cx, cy = self.widget.bbox()
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
+        if self.offset is None:
+            x, y, cx, cy = self.widget.bbox()
+            self.offset = (x + 25, y + 20)
+
+        x, y = self.offset
+        x += self.widget.winfo_rootx()
+        y += self.widget.winfo_rooty()
+
+        # Create the toplevel window once and reuse it afterwards
+        if self.window is None:
+            self.window = self.new_window()
 
-        # Create a toplevel window
-        self.window = self.new_window(x, y)
+        self.window.wm_geometry(f"+{x}+{y}")
+        self.window.deiconify()
         self.id = None
 
-    def new_window(self, x: int, y: int) -> Toplevel:
+    def new_window(self) -> Toplevel:
         window = Toplevel(self.widget)
+        window.wm_withdraw()
         window.wm_overrideredirect(True)
-        window.wm_geometry(f"+{x}+{y}")
         self.new_label(window)
         return window
 
     def new_label(self, master: Toplevel) -> Label:
-        label = Label(
-            master,
-            text=self.text,
-            background="lightyellow",
-            borderwidth=1,
-            relief="solid",
-            padding=PADDING
-        )
+        label = Label(master, text=self.text, **self.options)
         label.pack()
         return label
 
@@ -74,114 +168,48 @@ class ToolTip:
             self.widget.after_cancel(self.id)
             self.id = None
         if self.window:
-            self.window.destroy()
-            self.window = None
+            self.window.withdraw()
 
 
 class SharedState(ABC):
 
-    root: Tk
-    variables: Variables
-    icons: Icons
-    style: Style
-    tree: Treeview
-    cache: Dict[str, List[str]]
-
-    __shared__: dict = {}
-
-    @staticmethod
-    def get_service_id(tree: Treeview, value: str) -> str:
-        """
-        Check if service exists in `Treeview` and
-        return its `iid` value else `None`.
-        """
-        services: Tuple[str, ...] = tree.get_children()
-
-        for service in services:
-            name: str = tree.item(service, "text")
+    # shared by all frames, assigned once through the class:
+    root: Tk = None
+    variables: Variables = None
+    icons: Icons = None
+    style: Style = None
+    tree: Treeview = None
+    cache: Dict[str, List[str]] = None
 
-            if value.lower() == name.lower():
-                return service
+    # lowercased name -> `iid` lookups kept in sync with the `Treeview`:
+    _service_index: Dict[str, str] = None
+    _username_index: Dict[str, Dict[str, str]] = None
 
-    @staticmethod
-    def get_username_id(tree, service_id: str, username: str) -> str:
-        """Check if a username is present in the tree."""
-        usernames: Tuple[str, ...] = tree.get_children(service_id)
+    # `iid` -> displayed text, saves `Treeview.item` round-trips:
+    _iid_to_text: Dict[str, str] = None
 
-        for username_id in usernames:
-            item: str = tree.item(username_id, "text")
+    # pending cache write scheduled with `Tk.after`:
+    _flush_id: str = None
 
-            if username.lower() == item.lower():
-                return username_id
+    # set while the tree is being filled from cache:
+    _loading: bool = False
 
     @staticmethod
     def get_cache() -> Dict[str, List[str]]:
         """Read cached data and return it as a dictionary."""
         try:
-            cache: str = read_file(CACHE)
+            cache: bytes = read_file(CACHE)
         except FileNotFoundError:
             return dict()
         else:
-            return loads(cache)
+            return _loads(cache)
 
     @staticmethod
     def set_cache(cache: Dict[str, List[str]]):
         """Write `cache` data to user profile."""
         check_folder_path(KEYVAULT)
-        cache: str = dumps(cache)
-        write_file(cache, CACHE)
-
-    def __init__(self):
-        self.__shared__.update(self.__dict__)
-        self.__dict__ = self.__shared__
-
-    @property
-    def service(self) -> str:
-        return self.variables.service.get()
-
-    @service.setter
-    def service(self, value: str):
-        self.variables.service.set(value)
-
-    @service.deleter
-    def service(self):
-        self.variables.service.set("")
-
-    @property
-    def username(self) -> str:
-        return self.variables.username.get()
-
-    @username.setter
-    def username(self, value: str):
-        self.variables.username.set(value)
-
-    @username.deleter
-    def username(self):
-        self.variables.username.set("")
-
-    @property
-    def password(self) -> str:
-        return self.variables.password.get()
-
-    @password.setter
-    def password(self, value: str):
-        self.variables.password.set(value)
-
-    @password.deleter
-    def password(self):
-        self.variables.password.set("")
-
-    @property
-    def message(self) -> str:
-        return self.variables.notification.get()
-
-    @message.setter
-    def message(self, value: str):
-        self.variables.notification.set(value)
-
-    @message.deleter
-    def message(self):
-        self.variables.notification.set("")
+        data: bytes = _dumps(cache)
+        write_file(data, CACHE)
 
     @property
     def clipboard(self) -> str:
@@ -196,84 +224,106 @@ class SharedState(ABC):
     def clipboard(self):
         self.root.clipboard_clear()
 
+    def save_cache(self):
+        """Schedule a debounced write of `cache` to user profile."""
+        if self._flush_id is None:
+            SharedState._flush_id = self.root.after(500, self.flush_cache)
+
+    def flush_cache(self):
+        """Write pending `cache` changes to user profile."""
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            SharedState._flush_id = None
+            self.set_cache(self.cache)
+
     def show_info(self, msg: str):
         """Display an info `msg` in the notification section."""
         if (msg is not None) and (len(msg) > 0):
-            self.message = f"[INFO]: {msg}"
+            self.variables.notification.set(f"[INFO]: {msg}")
 
     def show_warning(self, msg: str):
         """Display a warning `msg` in the notification section."""
         if (msg is not None) and (len(msg) > 0):
-            self.message = f"[WARNING]: {msg}"
+            self.variables.notification.set(f"[WARNING]: {msg}")
 
     def show_error(self, msg: str):
         """Display an error `msg` in the notification section."""
         if (msg is not None) and (len(msg) > 0):
-            self.message = f"[ERROR]: {msg}"
+            self.variables.notification.set(f"[ERROR]: {msg}")
 
-    def add_username(self, service: str, username: str):
-        """Add a username to the tree."""
-        service_id: str = self.get_service_id(self.tree, service)
+    def get_service_id(self, value: str) -> str:
+        """
+        Check if service exists in `Treeview` and
+        return its `iid` value else `None`.
+        """
+        return self._service_index.get(value.lower())
+
+    def get_username_id(self, service_id: str, username: str) -> str:
+        """Check if a username is present in the tree."""
+        return self._username_index.get(service_id, {}).get(username.lower())
+
+    def _insert(self, service: str, username: str):
+        """
+        Insert the `service` and `username` nodes if missing and register
+        them in the lookup indexes.
+        """
+        service_id: str = self.get_service_id(service)
 
         if service_id is None:
             service_id = self.tree.insert(ROOT, END, text=service)
+            self._service_index[service.lower()] = service_id
+            self._username_index[service_id] = {}
+            self._iid_to_text[service_id] = service
 
-        if self.get_username_id(self.tree, service_id, username) is None:
-            self.tree.insert(service_id, END, text=username)
+        if self.get_username_id(service_id, username) is None:
+            username_id: str = self.tree.insert(service_id, END, text=username)
+            self._username_index[service_id][username.lower()] = username_id
+            self._iid_to_text[username_id] = username
+
+    def add_username(self, service: str, username: str):
+        """Add a username to the tree."""
+        self._insert(service, username)
 
     def del_username(self, service: str, username: str):
         """Delete a username from the tree."""
-        service_id: str = self.get_service_id(self.tree, service)
+        service_id: str = self.get_service_id(service)
 
         if service_id is not None:
+            usernames: Dict[str, str] = self._username_index[service_id]
+            username_id: str = usernames.pop(username.lower(), None)
 
-            for account_id in self.tree.get_children(service_id):
-                account: str = self.tree.item(account_id, "text")
-
-                if account.lower() != username.lower():
-                    continue
-
-                self.tree.delete(account_id)
+            if username_id is not None:
+                self.tree.delete(username_id)
+                del self._iid_to_text[username_id]
 
-            if len(self.tree.get_children(service_id)) == 0:
+            if len(usernames) == 0:
                 self.tree.delete(service_id)
-
-    def get_tree(self) -> Dict[str, List[str]]:
-        """Populate the widget with cached data."""
-        tree: Dict[str, List[str]] = {}
-        service_ids: Tuple[str, ...] = self.tree.get_children()
-
-        for service_id in service_ids:
-            service: str = self.tree.item(service_id, "text")
-            account_ids: Tuple[str, ...] = self.tree.get_children(service_id)
-            accounts: List[str] = [
-                self.tree.item(account_id, "text")
-                for account_id in account_ids
-            ]
-
-            tree.update({service: accounts})
-
-        return tree
+                del self._service_index[service.lower()]
+                del self._username_index[service_id]
+                del self._iid_to_text[service_id]
 
     def set_tree(self, cache: Dict[str, List[str]]):
         """Populate the widget with cached data."""
-        for key, value in cache.items():
-            for item in value:
-                self.add_username(key, item)
+        for service, usernames in cache.items():
+            for username in usernames:
+                self._insert(service, username)
 
 
 class KeyVault(SharedState):
     """Main window."""
 
     def __init__(self, master: Tk):
-        super(KeyVault, self).__init__()
-
         # shared:
-        self.root = master
-        self.variables = Variables(master)
-        self.icons = Icons(master)
-        self.style = Style(master)
-        self.cache = self.get_cache()
+        SharedState.root = master
+        SharedState.variables = Variables(master)
+        SharedState.icons = Icons(master)
+        SharedState.style = Style(master)
+        SharedState.cache = {}
+        SharedState._service_index = {}
+        SharedState._username_index = {}
+        SharedState._iid_to_text = {}
+        SharedState._flush_id = None
+        SharedState._loading = True
 
         # layout:
         self.root.title("KeyVault")
@@ -281,10 +331,10 @@ class KeyVault(SharedState):
         self.root.configure(background="white")
         self.root.rowconfigure(0, weight=1)
         self.root.columnconfigure(0, weight=1)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         # style:
-        for key, value in STYLE.items():
-            self.style.configure(key, background=value)
+        self.style.configure(".", background="white")
 
         main_frame: Frame = Frame(master, padding=PADDING)
         main_frame.grid(column=0, row=0, sticky=NSEW, padx=PADX, pady=PADY)
@@ -297,9 +347,58 @@ class KeyVault(SharedState):
         ToolboxFrame(main_frame)
         NotificationFrame(main_frame)
 
-        self.set_tree(self.cache)
+        self.root.after_idle(self.load_cache)
         self.set_size((560, 800), (320, 480))
 
+    def load_cache(self):
+        """
+        Read the cache once the window is drawn and populate the tree
+        in batches of accounts so the UI stays responsive for larger vaults.
+        """
+        try:
+            SharedState.cache = self.get_cache()
+            accounts: List[Tuple[str, str]] = [
+                (service, username)
+                for service, usernames in self.cache.items()
+                for username in usernames
+            ]
+        except (OSError, ValueError, TypeError, AttributeError) as error:
+            SharedState.cache = {}
+            SharedState._loading = False
+            self.show_error(f"Could not read cache: {error}")
+        else:
+            self.load_batch(chunks(accounts, 50))
+
+    def load_batch(self, batches: Iterator[Tuple[Tuple[str, str], ...]]):
+        """Insert the next batch of accounts and schedule the following one."""
+        batch: Tuple[Tuple[str, str], ...] = next(batches, None)
+
+        if batch is None:
+            SharedState._loading = False
+            return
+
+        cache: Dict[str, List[str]] = {}
+
+        for service, username in batch:
+            cache.setdefault(service, []).append(username)
+
+        try:
+            self.set_tree(cache)
+        except Exception as error:
+            SharedState._loading = False
+            self.show_error(f"Could not load vault: {error}")
+        else:
+            self.root.after(1, partial(self.load_batch, batches))
+
+    def close(self):
+        """
+        Write any pending cache changes, forget cached passwords
+        and destroy the window.
+        """
+        self.flush_cache()
+        _kr_cache.clear()
+        self.root.destroy()
+
     def set_size(self, width: Tuple[int, int], height: Tuple[int, int]):
         min_width, max_width = width
         min_height, max_height = height
@@ -310,15 +409,13 @@ class KeyVault(SharedState):
 class TreeFrame(SharedState):
 
     def __init__(self, master: Frame):
-        super(TreeFrame, self).__init__()
-
         # section:
         frame = LabelFrame(master, text="Vault", padding=PADDING)
         frame.grid(row=0, column=0, sticky=NSEW, padx=PADX, pady=PADY, rowspan=3)
         frame.rowconfigure(0, weight=1)
 
         # `ttk`.`TreeView` widgets:
-        self.tree = Treeview(frame, show="tree", selectmode=BROWSE, padding=PADDING)
+        SharedState.tree = Treeview(frame, show="tree", selectmode=BROWSE, padding=PADDING)
         self.tree.grid(row=0, column=0, sticky=NSEW, padx=LEFT, pady=UP)
 
         # # `ttk`.`Scrollbar` widgets:
@@ -340,17 +437,17 @@ class TreeFrame(SharedState):
 
         if len(selected) > 0:
             parent: str = tree.parent(selected)
-            value: str = tree.item(selected, "text")
+            value: str = self._iid_to_text[selected]
 
-            del self.service, self.username, self.password
+            self.variables.clear("service", "username", "password")
 
             if parent == ROOT:
-                self.service = value
+                self.variables.service.set(value)
                 self.show_info("Service selected.")
 
             else:
-                self.service = tree.item(parent, "text")
-                self.username = value
+                self.variables.service.set(self._iid_to_text[parent])
+                self.variables.username.set(value)
                 self.show_info("Username selected.")
 
 
@@ -365,8 +462,6 @@ class AccountFrame(SharedState):
         event.widget.configure(show=HIDDEN)
 
     def __init__(self, master: Frame):
-        super(AccountFrame, self).__init__()
-
         frame = LabelFrame(master, text="Account", padding=PADDING)
         frame.grid(row=0, column=1, sticky=NEW, padx=PADX, pady=PADY)
         frame.columnconfigure(1, weight=1)
@@ -419,39 +514,39 @@ class AccountFrame(SharedState):
         ToolTip(btn_6, "Paste")
 
     def copy_service(self):
-        self.clipboard = self.service
+        self.clipboard = self.variables.service.get()
         self.show_info("Service copied to clipboard.")
 
     def paste_service(self):
-        del self.service
+        self.variables.clear("service")
         try:
-            self.service = self.clipboard
+            self.variables.service.set(self.clipboard)
         except TclError:
             self.show_error("Clipboard empty!")
         else:
             self.show_info("Service pasted from clipboard.")
 
     def copy_username(self):
-        self.clipboard = self.username
+        self.clipboard = self.variables.username.get()
         self.show_info("Username copied to clipboard.")
 
     def paste_username(self):
-        del self.username
+        self.variables.clear("username")
         try:
-            self.username = self.clipboard
+            self.variables.username.set(self.clipboard)
         except TclError:
             self.show_error("Clipboard empty!")
         else:
             self.show_info("Username pasted from clipboard.")
 
     def copy_password(self):
-        self.clipboard = self.password
+        self.clipboard = self.variables.password.get()
         self.show_info("Password copied to clipboard.")
 
     def paste_password(self):
-        del self.password
+        self.variables.clear("password")
         try:
-            self.password = self.clipboard
+            self.variables.password.set(self.clipboard)
         except TclError:
             self.show_error("Clipboard empty!")
         else:
@@ -461,8 +556,6 @@ class AccountFrame(SharedState):
 class ClearFrame(SharedState):
 
     def __init__(self, master: Frame):
-        super(ClearFrame, self).__init__()
-
         # section:
         frame = Frame(master, padding=PADDING)
         frame.grid(row=1, column=1, sticky=NE, padx=PADX, pady=PADY)
@@ -473,15 +566,13 @@ class ClearFrame(SharedState):
 
     def clear_entries(self):
         """Clear all entries in the account section"""
-        del self.service, self.username, self.password
+        self.variables.clear("service", "username", "password")
         self.show_info("Cleared all entries!")
 
 
 class ToolboxFrame(SharedState):
 
     def __init__(self, master: Frame):
-        super(ToolboxFrame, self).__init__()
-
         frame: Frame = Frame(master, padding=PADDING)
         frame.grid(row=2, column=1, sticky=SE, padx=PADX, pady=PADY)
 
@@ -497,18 +588,25 @@ class ToolboxFrame(SharedState):
 
     def get_password(self):
         """Fetch a password from the keyring."""
-        del self.password
+        if self._loading:
+            self.show_warning("Vault is still loading!")
+            return
 
-        if (len(self.service) > 0) and (len(self.username) > 0):
-            value: str = get_password(self.service, self.username)
+        self.variables.clear("password")
+        service: str = self.variables.service.get()
+        username: str = self.variables.username.get()
+
+        if (len(service) > 0) and (len(username) > 0):
+            value: str = _get_password(service, username)
 
             if value is not None:
-                self.password = self.clipboard = value
-                self.add_account(self.service, self.username)
+                self.variables.password.set(value)
+                self.clipboard = value
+                self.add_account(service, username)
                 self.show_info("Password retrieved from keyring.")
 
             else:
-                self.del_account(self.service, self.username)
+                self.del_account(service, username)
                 self.show_warning("Password not found!")
 
         else:
@@ -516,52 +614,105 @@ class ToolboxFrame(SharedState):
 
     def set_password(self):
         """Save a password to the keyring."""
+        from keyring import set_password
+
+        if self._loading:
+            self.show_warning("Vault is still loading!")
+            return
+
+        service: str = self.variables.service.get()
+        username: str = self.variables.username.get()
+        password: str = self.variables.password.get()
+
         if (
-            len(self.service) > 0 and
-            len(self.username) > 0 and
-            len(self.password) > 0
+            len(service) > 0 and
+            len(username) > 0 and
+            len(password) > 0
         ):
-            set_password(self.service, self.username, self.password)
-            self.add_account(self.service, self.username)
-            self.clipboard = self.password
+            set_password(service, username, password)
+            _forget_password(service, username)
+            self.add_account(service, username)
+            self.clipboard = password
             self.show_info("Password saved to keyring.")
 
         else:
             self.show_warning("Service, username and password cannot be empty!")
 
     def del_password(self):
-        if len(self.service) > 0 and len(self.username) > 0:
+        """Delete a password from the keyring."""
+        from keyring import delete_password
+        from keyring.errors import PasswordDeleteError
+
+        if self._loading:
+            self.show_warning("Vault is still loading!")
+            return
+
+        service: str = self.variables.service.get()
+        username: str = self.variables.username.get()
+
+        if len(service) > 0 and len(username) > 0:
+            _forget_password(service, username)
+
             try:
-                delete_password(self.service, self.username)
+                delete_password(service, username)
             except PasswordDeleteError:
                 self.show_warning("Password not found in keyring!")
             else:
                 self.show_info("Password deleted from keyring.")
             finally:
-                self.del_account(self.service, self.username)
-                del self.service, self.username, self.password
+                self.del_account(service, username)
+                self.variables.clear("service", "username", "password")
 
         else:
             self.show_warning("Service and username cannot be empty!")
 
+    def get_account(self, service: str, username: str) -> Tuple[str, str]:
+        """
+        Return the `service` and `username` names as displayed in
+        the tree or `None` if the account is not present.
+        """
+        service_id: str = self.get_service_id(service)
+
+        if service_id is not None:
+            username_id: str = self.get_username_id(service_id, username)
+
+            if username_id is not None:
+                return (
+                    self._iid_to_text[service_id],
+                    self._iid_to_text[username_id],
+                )
+
     def add_account(self, service: str, username: str):
         """Add a new account to the vault and update cache."""
         self.add_username(service, username)
-        data: Dict[str, List[str]] = self.get_tree()
-        self.set_cache(data)
+        service, username = self.get_account(service, username)
+        usernames: List[str] = self.cache.setdefault(service, [])
+
+        if username not in usernames:
+            usernames.append(username)
+            self.save_cache()
 
     def del_account(self, service: str, username: str):
-        """Add a new account to the vault and update cache."""
-        self.del_username(service, username)
-        data: Dict[str, List[str]] = self.get_tree()
-        self.set_cache(data)
+        """Delete an account from the vault and update cache."""
+        account: Tuple[str, str] = self.get_account(service, username)
+
+        if account is not None:
+            self.del_username(service, username)
+            service, username = account
+            usernames: List[str] = self.cache.get(service, [])
+
+            if username in usernames:
+                usernames.remove(username)
+
+                if len(usernames) == 0:
+                    del self.cache[service]
+
+                self.save_cache()
 
 
 class NotificationFrame(SharedState):
 
     def __init__(self, master: Frame):
-        super(NotificationFrame, self).__init__()
-
         frame: Frame = Frame(master, padding=PADDING)
         frame.grid(row=3, column=0, sticky=NSEW, padx=PADX, pady=PADY, columnspan=2)
 